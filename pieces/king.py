@@ -1,6 +1,7 @@
 from utils.custom_type_hints import PLAYERS_TYPE, POSITION_TYPE, MOVE_LIST_TYPE
 from typing import Callable
 from pieces.piece import Piece
+from utils.move_tables import KING_MOVES
 
 
 class King(Piece):
@@ -61,65 +62,12 @@ class King(Piece):
                 List of all possible moves tuples of king
             """
 
-            current_row: int = position[0]
-            current_col: int = position[1]
             possible_moves_list: MOVE_LIST_TYPE = []
 
-            # For up
-            move_position = (current_row + 1, current_col)
-            if is_valid_position(move_position) and not is_player_piece(
-                player=self.player, position=move_position
-            ):
-                possible_moves_list.append(move_position)
-
-            # For down
-            move_position = (current_row - 1, current_col)
-            if is_valid_position(move_position) and not is_player_piece(
-                player=self.player, position=move_position
-            ):
-                possible_moves_list.append(move_position)
-
-            # For left
-            move_position = (current_row, current_col - 1)
-            if is_valid_position(move_position) and not is_player_piece(
-                player=self.player, position=move_position
-            ):
-                possible_moves_list.append(move_position)
-
-            # For right
-            move_position = (current_row, current_col + 1)
-            if is_valid_position(move_position) and not is_player_piece(
-                player=self.player, position=move_position
-            ):
-                possible_moves_list.append(move_position)
-
-            # For left upward
-            move_position = (current_row + 1, current_col - 1)
-            if is_valid_position(move_position) and not is_player_piece(
-                player=self.player, position=move_position
-            ):
-                possible_moves_list.append(move_position)
-
-            # For left downward
-            move_position = (current_row - 1, current_col - 1)
-            if is_valid_position(move_position) and not is_player_piece(
-                player=self.player, position=move_position
-            ):
-                possible_moves_list.append(move_position)
-
-            # For right upward
-            move_position = (current_row + 1, current_col + 1)
-            if is_valid_position(move_position) and not is_player_piece(
-                player=self.player, position=move_position
-            ):
-                possible_moves_list.append(move_position)
-
-            # For right downward
-            move_position = (current_row - 1, current_col + 1)
-            if is_valid_position(move_position) and not is_player_piece(
-                player=self.player, position=move_position
-            ):
-                possible_moves_list.append(move_position)
+            # For every precomputed one step move on board
+            for move_position in KING_MOVES[position]:
+                if not is_player_piece(player=self.player, position=move_position):
+                    possible_moves_list.append(move_position)
 
             return possible_moves_list
 
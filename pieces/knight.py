@@ -1,6 +1,7 @@
 from utils.custom_type_hints import PLAYERS_TYPE, POSITION_TYPE, MOVE_LIST_TYPE
 from typing import Callable
 from pieces.piece import Piece
+from utils.move_tables import KNIGHT_MOVES
 
 
 class Knight(Piece):
@@ -59,69 +60,12 @@ class Knight(Piece):
                 List of all possible moves tuples of knight
             """
 
-            current_row: int = position[0]
-            current_col: int = position[1]
             possible_moves_list: MOVE_LIST_TYPE = []
 
-            # L shape up
-            # For left
-            move_position = (current_row + 2, current_col - 1)
-            if is_valid_position(move_position) and not is_player_piece(
-                player=self.player, position=move_position
-            ):
-                possible_moves_list.append(move_position)
-
-            # For right
-            move_position = (current_row + 2, current_col + 1)
-            if is_valid_position(move_position) and not is_player_piece(
-                player=self.player, position=move_position
-            ):
-                possible_moves_list.append(move_position)
-
-            # L shape down
-            # For left
-            move_position = (current_row - 2, current_col - 1)
-            if is_valid_position(move_position) and not is_player_piece(
-                player=self.player, position=move_position
-            ):
-                possible_moves_list.append(move_position)
-
-            # For right
-            move_position = (current_row - 2, current_col + 1)
-            if is_valid_position(move_position) and not is_player_piece(
-                player=self.player, position=move_position
-            ):
-                possible_moves_list.append(move_position)
-
-            # L flipped shape up
-            # For left
-            move_position = (current_row + 1, current_col - 2)
-            if is_valid_position(move_position) and not is_player_piece(
-                player=self.player, position=move_position
-            ):
-                possible_moves_list.append(move_position)
-
-            # For right
-            move_position = (current_row + 1, current_col + 2)
-            if is_valid_position(move_position) and not is_player_piece(
-                player=self.player, position=move_position
-            ):
-                possible_moves_list.append(move_position)
-
-            # L flipped shape down
-            # For left
-            move_position = (current_row - 1, current_col - 2)
-            if is_valid_position(move_position) and not is_player_piece(
-                player=self.player, position=move_position
-            ):
-                possible_moves_list.append(move_position)
-
-            # For right
-            move_position = (current_row - 1, current_col + 2)
-            if is_valid_position(move_position) and not is_player_piece(
-                player=self.player, position=move_position
-            ):
-                possible_moves_list.append(move_position)
+            # For every precomputed L shape move on board
+            for move_position in KNIGHT_MOVES[position]:
+                if not is_player_piece(player=self.player, position=move_position):
+                    possible_moves_list.append(move_position)
 
             return possible_moves_list
 
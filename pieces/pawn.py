@@ -117,53 +117,55 @@ class Pawn(Piece):
             """
 
             possible_moves_list: MOVE_LIST_TYPE = []
-            dir = self.direction
-            opp = self.opponent_player
+            current_row: int = position[0]
+            current_col: int = position[1]
+            forward_row: int = current_row + self.direction(1)
+            enemy_player: PLAYERS_TYPE = self.opponent_player()
 
             # For first move
             if self.is_first_move:
-                move_position = (position[0] + dir(2), position[1])
+                move_position = (current_row + self.direction(2), current_col)
                 if is_valid_position(move_position) and not is_piece(move_position):
                     possible_moves_list.append(move_position)
 
             # For normal move
-            move_position = (position[0] + dir(1), position[1])
+            move_position = (forward_row, current_col)
             if is_valid_position(move_position) and not is_piece(move_position):
                 possible_moves_list.append(move_position)
 
             # For left forward kill
-            move_position = (position[0] + dir(1), position[1] - 1)
+            move_position = (forward_row, current_col - 1)
             if is_valid_position(move_position) and is_player_piece(
-                player=opp(), position=move_position
+                player=enemy_player, position=move_position
             ):
                 possible_moves_list.append(move_position)
 
             # For right forward kill
-            move_position = (position[0] + dir(1), position[1] + 1)
+            move_position = (forward_row, current_col + 1)
             if is_valid_position(move_position) and is_player_piece(
-                player=opp(), position=move_position
+                player=enemy_player, position=move_position
             ):
                 possible_moves_list.append(move_position)
 
             # For left en passant
-            piece_to_kill_position = (position[0], position[1] - 1)
+            piece_to_kill_position = (current_row, current_col - 1)
             if is_valid_position(piece_to_kill_position) and is_player_piece(
-                player=opp(), position=piece_to_kill_position
+                player=enemy_player, position=piece_to_kill_position
             ):
-                piece_to_kill = board[position[0]][position[1] - 1]
+                piece_to_kill = board[current_row][current_col - 1]
                 if isinstance(piece_to_kill, Pawn) and piece_to_kill.is_en_passant:
-                    move_position = (position[0] + dir(1), position[1] - 1)
+                    move_position = (forward_row, current_col - 1)
                     possible_moves_list.append(move_position)
                     piece_to_kill.is_en_passant = False
 
             # For right en passant
-            piece_to_kill_position = (position[0], position[1] + 1)
+            piece_to_kill_position = (current_row, current_col + 1)
             if is_valid_position(piece_to_kill_position) and is_player_piece(
-                player=opp(), position=piece_to_kill_position
+                player=enemy_player, position=piece_to_kill_position
             ):
-                piece_to_kill = board[position[0]][position[1] + 1]
+                piece_to_kill = board[current_row][current_col + 1]
                 if isinstance(piece_to_kill, Pawn) and piece_to_kill.is_en_passant:
-                    move_position = (position[0] + dir(1), position[1] + 1)
+                    move_position = (forward_row, current_col + 1)
                     possible_moves_list.append(move_position)
                     piece_to_kill.is_en_passant = False
 
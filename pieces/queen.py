@@ -1,6 +1,7 @@
 from utils.custom_type_hints import PLAYERS_TYPE, POSITION_TYPE, MOVE_LIST_TYPE
 from typing import Callable
 from pieces.piece import Piece
+from utils.move_tables import QUEEN_RAYS
 
 
 class Queen(Piece):
@@ -61,112 +62,17 @@ class Queen(Piece):
                 List of all possible moves tuples of bishop
             """
 
-            current_row: int = position[0]
-            current_col: int = position[1]
             enemy_player: PLAYERS_TYPE = "white" if self.player == "black" else "black"
             possible_moves_list: MOVE_LIST_TYPE = []
 
-            # For rook moves
-            # For vertical moves
-
-            # For forward moves
-            for row in range(current_row + 1, 9):
-                move_position = (row, current_col)
-                if is_piece(move_position):
-                    if is_player_piece(player=enemy_player, position=move_position):
-                        possible_moves_list.append(move_position)
-                    break
-                possible_moves_list.append(move_position)
-
-            # For backward moves
-            for row in range(current_row - 1, 0, -1):
-                move_position = (row, current_col)
-                if is_piece(move_position):
-                    if is_player_piece(player=enemy_player, position=move_position):
-                        possible_moves_list.append(move_position)
-                    break
-                possible_moves_list.append(move_position)
-
-            # For horizontal moves
-
-            # For right moves
-            for col in range(current_col + 1, 9):
-                move_position = (current_row, col)
-                if is_piece(move_position):
-                    if is_player_piece(player=enemy_player, position=move_position):
-                        possible_moves_list.append(move_position)
-                    break
-                possible_moves_list.append(move_position)
-
-            # For left moves
-            for col in range(current_col - 1, 0, -1):
-                move_position = (current_row, col)
-                if is_piece(move_position):
-                    if is_player_piece(player=enemy_player, position=move_position):
-                        possible_moves_list.append(move_position)
-                    break
-                possible_moves_list.append(move_position)
-
-            # Bishop Moves
-            # For left moves
-
-            # For left upward moves
-            row = current_row + 1
-            col = current_col - 1
-            move_position = (row, col)
-            while is_valid_position(move_position):
-                if is_piece(move_position):
-                    if is_player_piece(player=enemy_player, position=move_position):
-                        possible_moves_list.append(move_position)
-                    break
-                possible_moves_list.append(move_position)
-                row += 1
-                col -= 1
-                move_position = (row, col)
-
-            # For left downward moves
-            row = current_row - 1
-            col = current_col - 1
-            move_position = (row, col)
-            while is_valid_position(move_position):
-                if is_piece(move_position):
-                    if is_player_piece(player=enemy_player, position=move_position):
-                        possible_moves_list.append(move_position)
-                    break
-                possible_moves_list.append(move_position)
-                row -= 1
-                col -= 1
-                move_position = (row, col)
-
-            # For right moves
-
-            # For right upward moves
-            row = current_row + 1
-            col = current_col + 1
-            move_position = (row, col)
-            while is_valid_position(move_position):
-                if is_piece(move_position):
-                    if is_player_piece(player=enemy_player, position=move_position):
-                        possible_moves_list.append(move_position)
-                    break
-                possible_moves_list.append(move_position)
-                row += 1
-                col += 1
-                move_position = (row, col)
-
-            # For right downward moves
-            row = current_row - 1
-            col = current_col + 1
-            move_position = (row, col)
-            while is_valid_position(move_position):
-                if is_piece(move_position):
-                    if is_player_piece(player=enemy_player, position=move_position):
-                        possible_moves_list.append(move_position)
-                    break
-                possible_moves_list.append(move_position)
-                row -= 1
-                col += 1
-                move_position = (row, col)
+            # For every precomputed ray, nearest square first
+            for ray in QUEEN_RAYS[position]:
+                for move_position in ray:
+                    if is_piece(move_position):
+                        if is_player_piece(player=enemy_player, position=move_position):
+                            possible_moves_list.append(move_position)
+                        break
+                    possible_moves_list.append(move_position)
 
             return possible_moves_list
 
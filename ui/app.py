@@ -9,7 +9,7 @@ from utils.custom_type_hints import (
     UI_POSITION_TYPE,
     PLAYERS_TYPE,
 )
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict, List, Set
 
 
 class App(CTk):
@@ -114,6 +114,18 @@ class App(CTk):
 
         sqaures : UI_POSITION_TYPE
             8 x 8 table containing Tkinter UI Square Buttons starting from 0 index
+
+        piece_images : Dict[str, CTkImage]
+            Cache of loaded piece images keyed by image path
+
+        square_images : List[List[Optional[CTkImage]]]
+            8 x 8 table of image objects currently shown on UI square buttons
+
+        enabled_squares : Set[UI_POSITION_TYPE]
+            Positions of UI square buttons which are currently clickable
+
+        possible_moves_cache : Dict[POSITION_TYPE, MOVE_LIST_TYPE]
+            Possible moves of pieces already clicked in current turn
         """
 
         # Call parent constructor
@@ -133,6 +145,12 @@ class App(CTk):
         )
         self.move_piece: Callable[[POSITION_TYPE], MOVE_LIST_TYPE] = move_piece
         self.squares: UI_POSITION_TYPE = [[None for _ in range(8)] for _ in range(8)]
+        self.piece_images: Dict[str, CTkImage] = {}
+        self.square_images: List[List[Optional[CTkImage]]] = [
+            [None for _ in range(8)] for _ in range(8)
+        ]
+        self.enabled_squares: Set[UI_POSITION_TYPE] = set()
+        self.possible_moves_cache: Dict[POSITION_TYPE, MOVE_LIST_TYPE] = {}
 
         # Build UI
         self.build_ui()
@@ -169,15 +187,7 @@ class App(CTk):
                     )
 
                 # Set image object of piece
-                image_path: Optional[str] = None
-                if piece is not None:
-                    image_path = f"assets/pieces/{piece.get_image_path()}"
-
-                image_obj = None
-                if image_path:
-                    image_obj = CTkImage(
-                        light_image=Image.open(image_path), size=(60, 106)
-                    )
+                image_obj: Optional[CTkImage] = self.get_piece_image(piece)
 
                 # Get corresponding position tuple of UI square board
                 (ui_row, ui_col) = self.get_ui_position(position)
@@ -194,6 +204,41 @@ class App(CTk):
                 # Add UI square button to screen
                 self.squares[ui_row][ui_col].grid(row=ui_row, column=ui_col)
 
+                # Remember current state of UI square button
+                self.square_images[ui_row][ui_col] = image_obj
+                if square_state == "normal":
+                    self.enabled_squares.add((ui_row, ui_col))
+
+    def get_piece_image(self, piece: Optional[PIECE_TYPE]) -> Optional[CTkImage]:
+        """
+        Method which returns image object of piece
+        Images are loaded from disk once and reused on every turn update
+
+
+        Parameters
+        ----------
+        piece : Optional[PIECE_TYPE]
+            Child object of Piece class
+
+
+        Return
+        ------
+        Optional[CTkImage]
+            Image object of piece or None if there is no piece
+        """
+
+        if piece is None:
+            return None
+
+        image_path: str = f"assets/pieces/{piece.get_image_path()}"
+
+        if image_path not in self.piece_images:
+            self.piece_images[image_path] = CTkImage(
+                light_image=Image.open(image_path), size=(60, 106)
+            )
+
+        return self.piece_images[image_path]
+
     def update_possible_moves_ui(self, position: POSITION_TYPE):
         """
         Method which updates UI by enabling UI square buttons where clicked piece can be moved
@@ -221,9 +266,13 @@ class App(CTk):
         self.squares[curr_ui_row][curr_ui_col].configure(
             state="normal", command=self.update_turn
         )
+        self.enabled_squares.add((curr_ui_row, curr_ui_col))
 
         # Get all possible moves list of piece at current position
-        moves_list = self.get_possible_moves(position)
+        # Computed once per turn, board does not change until a move is made
+        if position not in self.possible_moves_cache:
+            self.possible_moves_cache[position] = self.get_possible_moves(position)
+        moves_list: MOVE_LIST_TYPE = self.possible_moves_cache[position]
 
         # Configure move position with command to update move
         for move in moves_list:
@@ -234,6 +283,7 @@ class App(CTk):
                     curr_pos, move_pos
                 ),
             )
+            self.enabled_squares.add((ui_row, ui_col))
 
     def update_move(self, curr_pos, move_pos):
         """
@@ -258,6 +308,9 @@ class App(CTk):
         # Move Piece
         self.move_piece(curr_pos, move_pos)
 
+        # Discard possible moves of previous turn
+        self.possible_moves_cache.clear()
+
         # Change player turn
         self.is_black_player = not self.is_black_player
 
@@ -268,6 +321,9 @@ class App(CTk):
         """
         Method which update UI for next move
         Runs on completion of move
+
+        Only UI square buttons whose state or image changes are reconfigured,
+        disabled empty squares are left untouched
         """
 
         # Get player turn
@@ -295,33 +351,47 @@ class App(CTk):
                     )
 
                 # Set image object of piece
-                image_path: Optional[str] = None
-                if piece is not None:
-                    image_path = f"assets/pieces/{piece.get_image_path()}"
-
-                image_obj = None
-                if image_path:
-                    image_obj = CTkImage(
-                        light_image=Image.open(image_path), size=(60, 106)
-                    )
+                image_obj: Optional[CTkImage] = self.get_piece_image(piece)
 
                 # Get corresponding position tuple of UI square board
                 (ui_row, ui_col) = self.get_ui_position(position)
 
-                # Configure UI square button
-                self.squares[ui_row][ui_col].configure(
-                    state=square_state, command=square_command, image=image_obj
+                # Skip UI square button if it stays disabled with same image
+                is_image_changed: bool = (
+                    image_obj is not self.square_images[ui_row][ui_col]
                 )
+                if (
+                    square_state == "disabled"
+                    and (ui_row, ui_col) not in self.enabled_squares
+                    and not is_image_changed
+                ):
+                    continue
+
+                # Configure UI square button
+                if is_image_changed:
+                    self.squares[ui_row][ui_col].configure(
+                        state=square_state, command=square_command, image=image_obj
+                    )
+                    self.square_images[ui_row][ui_col] = image_obj
+                else:
+                    self.squares[ui_row][ui_col].configure(
+                        state=square_state, command=square_command
+                    )
+
+                # Remember clickable UI square buttons
+                if square_state == "normal":
+                    self.enabled_squares.add((ui_row, ui_col))
+                else:
+                    self.enabled_squares.discard((ui_row, ui_col))
 
     def disable_all(self):
         """
         Method which disables all UI square buttons from clicking
         """
 
-        for i in range(8):
-            for j in range(8):
-                self.squares[i][j].configure(state="disabled")
-        # pass
+        for i, j in self.enabled_squares:
+            self.squares[i][j].configure(state="disabled")
+        self.enabled_squares.clear()
 
     def center_screen(self, width, height):
         """
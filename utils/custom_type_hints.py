@@ -1,4 +1,4 @@
-from typing import Literal, Tuple, List
+from typing import Literal, Tuple, List, Dict
 
 ALPHABET_COL_TYPE = Literal["a", "b", "c", "d", "e", "f", "g", "h"]
 NUM_COL_TYPE = Literal[1, 2, 3, 4, 5, 6, 7, 8]
@@ -9,3 +9,5 @@ POSITION_TYPE = Tuple[NUM_ROW_TYPE, NUM_COL_TYPE]
 UI_POSITION_TYPE = Tuple[UI_NUM_ROW_TYPE, UI_NUM_COL_TYPE]
 MOVE_LIST_TYPE = List[Tuple[NUM_ROW_TYPE, NUM_COL_TYPE]]
 PLAYERS_TYPE = Literal["white", "black"]
+MOVE_TABLE_TYPE = Dict[POSITION_TYPE, Tuple[POSITION_TYPE, ...]]
+RAY_TABLE_TYPE = Dict[POSITION_TYPE, Tuple[Tuple[POSITION_TYPE, ...], ...]]
@@ -0,0 +1,100 @@
+from typing import Tuple
+from constants import NUM_ROW, NUM_COL
+from utils.custom_type_hints import MOVE_TABLE_TYPE, RAY_TABLE_TYPE
+
+# Step offsets ( row_step , column_step ) in the order moves are listed
+
+KNIGHT_OFFSETS: Tuple[Tuple[int, int], ...] = (
+    (2, -1),
+    (2, 1),
+    (-2, -1),
+    (-2, 1),
+    (1, -2),
+    (1, 2),
+    (-1, -2),
+    (-1, 2),
+)
+
+KING_OFFSETS: Tuple[Tuple[int, int], ...] = (
+    (1, 0),
+    (-1, 0),
+    (0, -1),
+    (0, 1),
+    (1, -1),
+    (-1, -1),
+    (1, 1),
+    (-1, 1),
+)
+
+ROOK_DIRECTIONS: Tuple[Tuple[int, int], ...] = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+BISHOP_DIRECTIONS: Tuple[Tuple[int, int], ...] = ((1, -1), (-1, -1), (1, 1), (-1, 1))
+
+
+def build_move_table(offsets: Tuple[Tuple[int, int], ...]) -> MOVE_TABLE_TYPE:
+    """
+    Function which returns on-board target positions of a one step piece for every square
+
+
+    Parameters
+    ----------
+    offsets : Tuple[Tuple[int, int], ...]
+        Tuple of step offsets ( row_step , column_step )
+
+
+    Return
+    ------
+    move_table : MOVE_TABLE_TYPE
+        Mapping of position tuple to tuple of target position tuples
+    """
+
+    move_table: MOVE_TABLE_TYPE = {}
+    for row in NUM_ROW:
+        for col in NUM_COL:
+            move_table[(row, col)] = tuple(
+                (row + row_step, col + col_step)
+                for row_step, col_step in offsets
+                if row + row_step in NUM_ROW and col + col_step in NUM_COL
+            )
+    return move_table
+
+
+def build_ray_table(directions: Tuple[Tuple[int, int], ...]) -> RAY_TABLE_TYPE:
+    """
+    Function which returns rays of a sliding piece for every square
+
+
+    Parameters
+    ----------
+    directions : Tuple[Tuple[int, int], ...]
+        Tuple of direction steps ( row_step , column_step )
+
+
+    Return
+    ------
+    ray_table : RAY_TABLE_TYPE
+        Mapping of position tuple to one ray per direction, each ray is a tuple of
+        position tuples ordered from nearest to farthest square
+    """
+
+    ray_table: RAY_TABLE_TYPE = {}
+    for row in NUM_ROW:
+        for col in NUM_COL:
+            rays = []
+            for row_step, col_step in directions:
+                ray = []
+                move_row, move_col = row + row_step, col + col_step
+                while move_row in NUM_ROW and move_col in NUM_COL:
+                    ray.append((move_row, move_col))
+                    move_row += row_step
+                    move_col += col_step
+                rays.append(tuple(ray))
+            ray_table[(row, col)] = tuple(rays)
+    return ray_table
+
+
+KNIGHT_MOVES: MOVE_TABLE_TYPE = build_move_table(KNIGHT_OFFSETS)
+KING_MOVES: MOVE_TABLE_TYPE = build_move_table(KING_OFFSETS)
+ROOK_RAYS: RAY_TABLE_TYPE = build_ray_table(ROOK_DIRECTIONS)
+BISHOP_RAYS: RAY_TABLE_TYPE = build_ray_table(BISHOP_DIRECTIONS)
+QUEEN_RAYS: RAY_TABLE_TYPE = build_ray_table(ROOK_DIRECTIONS + BISHOP_DIRECTIONS)